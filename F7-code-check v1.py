@@ -1,111 +1,155 @@
+import csv
 import math
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+E_STEEL = 29000.0  # ksi, modulus of elasticity of structural steel
+
+LIMIT_STATES = (
+    "Yielding",
+    "Flange Local Buckling",
+    "Web Local Buckling",
+    "Lateral-Torsional Buckling",
+)
+
+# Bending axis
+MAJOR = 0
+MINOR = 1
+
+# Element compactness (Table B4.1b)
+COMPACT = 0
+NONCOMPACT = 1
+SLENDER = 2
+
+_AXIS_NAMES = ("Major", "Minor")
+_CLASS_NAMES = ("Compact", "Noncompact", "Slender")
+
+
+def classify_hss_f7(bt, ht, Fy, E=E_STEEL, sqrt_E_Fy=None):
+    """
+    AISC 360-16 | Table B4.1b, cases 17 (flanges) and 19 (webs)
+    Compactness of rectangular HSS walls in flexure.  Works on floats or
+    arrays; callers that already hold sqrt(E/Fy) may pass it.  Returns
+    (flange_class, web_class) as COMPACT / NONCOMPACT / SLENDER codes.
+    """
+
+    if sqrt_E_Fy is None:
+        sqrt_E_Fy = (E / Fy) ** 0.5
+
+    # 1 * (...) keeps array results integer rather than boolean
+    flange_class = 1 * (bt > 1.12 * sqrt_E_Fy) + (bt > 1.40 * sqrt_E_Fy)
+    web_class = 1 * (ht > 2.42 * sqrt_E_Fy) + (ht > 5.70 * sqrt_E_Fy)
+
+    return flange_class, web_class
+
 
 def flexural_strength_hss_f7(
     Fy, E, Ag,
-    Sx, Sy,
+    Z, S,
     ry, J,
     b, tf, h, tw,
     Lb, Cb,
-    My, Mz
+    section_type, bending_axis, flange_class, web_class,
+    method=None
 ):
     """
     AISC 360-16 | Chapter F7
     Flexural strength of square / rectangular HSS and box sections
+
+    Z and S are taken about the bending axis.  bending_axis is
+    MAJOR / MINOR and flange_class / web_class are
+    COMPACT / NONCOMPACT / SLENDER, classified once by the caller
+    (see classify_hss_f7).
     """
 
     # 1. Verify Applicability
-    if section.type != "SectionType.HSS":
+    if section_type not in ("SectionType.HSS", "SectionType.BOX"):
         raise ValueError("Chapter F7 applies only to HSS / BOX sections")
 
-    section_type = section.type
     is_square = abs(b - h) < 1e-6
 
-    # 2. Identify Bending Axis
-    axis_enum, _, _ = classify_bending_axis(section=section, My=My, Mz=Mz)
-    bending_axis = axis_enum.value  # "major" or "minor"
-
-    if bending_axis == "major":
-        S = Sx
-        Z = section.Zx
-    else:
-        S = Sy
-        Z = section.Zy
-
-    # 3. Compactness Classification (B4.1)
-    compactness = classify_section(section=section, material=material)
-
-    flange_class = compactness["elements"]["flange"]["classification"].capitalize()
-    web_class = compactness["elements"]["web"]["classification"].capitalize()
+    # 2. Bending Axis and 3. Compactness Classification (B4.1) are
+    # supplied by the caller
 
     # 4. Plastic Moment Capacity (Yielding)
     Mp = Fy * Z
 
+    sqrt_E_Fy = math.sqrt(E / Fy)
+    sqrt_Fy_E = 1.0 / sqrt_E_Fy
+    sqrt_JAg = math.sqrt(J * Ag)
+
+    # Slenderness ratios and yield moment shared by all limit states
+    bt = b / tf
+    ht = h / tw
+    FyS = Fy * S
+    seven_tenths_FyS = 0.7 * FyS
+
     Mn_FLB = None
     Mn_WLB = None
     Mn_LTB = None
 
     # 5. Flange Local Buckling (F7-2, F7-3)
-    if flange_class == "Noncompact":
-        Mn_FLB = Mp - (Mp - Fy * S) * (
-            3.57 * (b / tf) * math.sqrt(Fy / E) - 4.0
-        )
-        Mn_FLB = min(Mn_FLB, Mp)
+    if flange_class == NONCOMPACT:
+        term = max(3.57 * bt * sqrt_Fy_E - 4.0, 0.0)
+        Mn_FLB = Mp - (Mp - FyS) * term
 
-    elif flange_class == "Slender":
+    elif flange_class == SLENDER:
+        inv_b = 1.0 / b
+        inv_bt = tf * inv_b
         if section_type == "SectionType.HSS":
-            be = 1.92 * tf * math.sqrt(E / Fy) * (
-                1 - 0.38 / ((b / tf) * math.sqrt(E / Fy))
-            )
+            be = 1.92 * tf * sqrt_E_Fy * (1.0 - 0.38 * inv_bt * sqrt_E_Fy)
         else:  # BOX
-            be = 1.92 * tf * math.sqrt(E / Fy) * (
-                1 - 0.34 / ((b / tf) * math.sqrt(E / Fy))
-            )
+            be = 1.92 * tf * sqrt_E_Fy * (1.0 - 0.34 * inv_bt * sqrt_E_Fy)
 
         be = min(be, b)
-        Se = S * (be / b)
-        Mn_FLB = Fy * Se
+        Mn_FLB = FyS * be * inv_b  # Fy * Se, Se = S * be / b
 
     # Compact flange → FLB not applicable
 
     # 6. Web Local Buckling (F7-6)
-    if web_class == "Noncompact":
-        Mn_WLB = Mp - (Mp - Fy * S) * (
-            0.305 * (h / tw) * math.sqrt(Fy / E) - 0.738
-        )
-        Mn_WLB = min(Mn_WLB, Mp)
+    if web_class == NONCOMPACT:
+        term = max(0.305 * ht * sqrt_Fy_E - 0.738, 0.0)
+        Mn_WLB = Mp - (Mp - FyS) * term
 
-    # Slender web does not occur for HSS per AISC note
+    elif web_class == SLENDER:
+        Mn_WLB = math.nan  # slender web, F7-7 to F7-9 not covered
 
     # 7. Lateral–Torsional Buckling (F7-10, F7-11)
-    if not is_square and bending_axis == "major":
+    if not is_square and bending_axis == MAJOR:
 
-        Lp = 0.13 * E * ry * math.sqrt(J * Ag) / Mp
-        Lr = 2 * E * ry * math.sqrt(J * Ag) / (0.7 * Fy * S)
+        E_ry_sqrt_JAg = E * ry * sqrt_JAg
+        Lp = 0.13 * E_ry_sqrt_JAg / Mp
+        Lr = 2 * E_ry_sqrt_JAg / seven_tenths_FyS
 
         if Lb <= Lp:
             Mn_LTB = Mp
 
-        elif Lp < Lb <= Lr:
+        elif Lb <= Lr:
             Mn_LTB = Cb * (
-                Mp - (Mp - 0.7 * Fy * S) * ((Lb - Lp) / (Lr - Lp))
+                Mp - (Mp - seven_tenths_FyS) * ((Lb - Lp) / (Lr - Lp))
             )
             Mn_LTB = min(Mn_LTB, Mp)
 
         else:
-            Mn_LTB = 2 * E * Cb * math.sqrt(J * Ag) / (Lb / ry)
+            Mn_LTB = 2 * Cb * E_ry_sqrt_JAg / Lb
             Mn_LTB = min(Mn_LTB, Mp)
 
     # 8. Governing Nominal Flexural Strength
-    candidates = {
-        "Yielding": Mp,
-        "Flange Local Buckling": Mn_FLB,
-        "Web Local Buckling": Mn_WLB,
-        "Lateral-Torsional Buckling": Mn_LTB
-    }
-
-    applicable = {k: v for k, v in candidates.items() if v is not None}
-    governing_limit_state = min(applicable, key=applicable.get)
-    Mn = applicable[governing_limit_state]
+    # (inapplicable limit states fall back to Mp so Yielding wins ties)
+    candidates = (
+        Mp,
+        Mp if Mn_FLB is None else Mn_FLB,
+        Mp if Mn_WLB is None else Mn_WLB,
+        Mp if Mn_LTB is None else Mn_LTB,
+    )
+    if web_class == SLENDER:
+        i = 2  # NaN propagates to Mn, as in calculate_nominal_strength
+    else:
+        i = min(range(4), key=candidates.__getitem__)
+    Mn = candidates[i]
+    governing_limit_state = LIMIT_STATES[i]
 
     # 9. Output (As per your required schema)
     return {
@@ -119,9 +163,373 @@ def flexural_strength_hss_f7(
         "Mn_FLB": Mn_FLB,
         "Mn_WLB": Mn_WLB,
         "Mn_LTB": Mn_LTB,
-        "bending_axis": bending_axis.capitalize(),
+        "bending_axis": _AXIS_NAMES[bending_axis],
         "section_type": section_type,
-        "flange_compactness": flange_class,
-        "web_compactness": web_class,
-        "status": "PASS"
+        "flange_compactness": _CLASS_NAMES[flange_class],
+        "web_compactness": _CLASS_NAMES[web_class],
+        "status": "NOT COVERED" if web_class == SLENDER else "PASS"
     }
+
+
+def flexural_strength_hss_f7_dict(data):
+    """
+    AISC 360-16 | Chapter F7
+    flexural_strength_hss_f7 taking its inputs as a dict keyed by the
+    argument names (Cb defaults to 1.0, method to None).
+    """
+
+    return flexural_strength_hss_f7(
+        data["Fy"], data["E"], data["Ag"],
+        data["Z"], data["S"],
+        data["ry"], data["J"],
+        data["b"], data["tf"], data["h"], data["tw"],
+        data["Lb"], data.get("Cb", 1.0),
+        data["section_type"], data["bending_axis"],
+        data["flange_class"], data["web_class"],
+        method=data.get("method"),
+    )
+
+
+def _hss_geometry(B, H, t_nom, sqrt):
+    """
+    Geometric properties of a rectangular HSS (sharp-corner model, design
+    wall thickness per B4.2).  Corner radii are ignored, so Zx in particular
+    is overstated relative to published values.  Works on floats or arrays
+    given the matching sqrt.  Returns (t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J).
+    """
+
+    t = 0.93 * t_nom
+    b = B - 3.0 * t
+    h = H - 3.0 * t
+    Bi = B - 2.0 * t
+    Hi = H - 2.0 * t
+
+    Ag = B * H - Bi * Hi
+    Ix = (B * H ** 3 - Bi * Hi ** 3) / 12.0
+    Iy = (H * B ** 3 - Hi * Bi ** 3) / 12.0
+    Sx = 2.0 * Ix / H
+    Zx = (B * H ** 2 - Bi * Hi ** 2) / 4.0
+    ry = sqrt(Iy / Ag)
+    J = 2.0 * t * (B - t) ** 2 * (H - t) ** 2 / (B + H - 2.0 * t)
+
+    return t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J
+
+
+def calculate_nominal_strength_batch(B, H, t_nom, Fy, Lb, E=E_STEEL, Cb=1.0):
+    """
+    AISC 360-16 | Chapter F7
+    Vectorized nominal flexural strength of rectangular HSS bent about the
+    x-axis (H = overall depth, B = overall width).  All arguments broadcast
+    as NumPy arrays; limit states that do not apply are returned as inf.
+    Slender webs (F7-7 to F7-9) are not covered and give NaN.
+
+    Section properties use a sharp-corner model and are approximate and
+    unconservative: ignoring the corner radius overstates Zx, so Mp and Mn
+    run high (about 4% for HSS8x6x1/2).  Use published properties, via
+    f7_check_shape, for design values.
+    """
+
+    B = np.asarray(B, dtype=float)
+    H = np.asarray(H, dtype=float)
+    t_nom = np.asarray(t_nom, dtype=float)
+    Fy = np.asarray(Fy, dtype=float)
+    Lb = np.asarray(Lb, dtype=float)
+    E = np.asarray(E, dtype=float)
+    Cb = np.asarray(Cb, dtype=float)
+
+    # 1. Section Properties
+    t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J = _hss_geometry(B, H, t_nom, np.sqrt)
+
+    sqrt_E_Fy = np.sqrt(E / Fy)
+    inf_arr = np.full(np.broadcast(B, H, t_nom, Fy, Lb, E, Cb).shape, np.inf)
+
+    # 2. Plastic Moment Capacity (F7-1)
+    Mp = Fy * Zx
+    FyS = Fy * Sx
+
+    # Every branch below is evaluated on every lane and blended with
+    # np.select; denominators that vanish on discarded lanes are guarded.
+
+    # Compactness (Table B4.1b)
+    inv_t = 1.0 / t
+    bt = b * inv_t
+    ht = h * inv_t
+    flange_class, web_class = classify_hss_f7(bt, ht, Fy, E, sqrt_E_Fy)
+
+    # 3. Flange Local Buckling (F7-2, F7-3, F7-4)
+    flb_term = np.maximum(3.57 * bt / sqrt_E_Fy - 4.0, 0.0)
+    Mn_flb_nc = Mp - (Mp - FyS) * flb_term
+    inv_b = np.divide(1.0, b, out=np.zeros(b.shape), where=b > 0)
+    be = 1.92 * t * sqrt_E_Fy * (1.0 - 0.38 * t * inv_b * sqrt_E_Fy)
+    Mn_flb_sl = FyS * np.minimum(be, b) * inv_b
+    Mn_flb = np.select(
+        [flange_class == COMPACT, flange_class == NONCOMPACT],
+        [inf_arr, Mn_flb_nc],
+        default=Mn_flb_sl,
+    )
+
+    # 4. Web Local Buckling (F7-6)
+    wlb_term = np.maximum(0.305 * ht / sqrt_E_Fy - 0.738, 0.0)
+    Mn_wlb_nc = Mp - (Mp - FyS) * wlb_term
+    Mn_wlb = np.select(
+        [web_class == COMPACT, web_class == NONCOMPACT],
+        [inf_arr, Mn_wlb_nc],
+        default=np.nan,
+    )
+
+    # 5. Lateral-Torsional Buckling (F7-10 to F7-13), major axis only
+    sqrt_JAg = np.sqrt(J * Ag)
+    Lp = 0.13 * E * ry * sqrt_JAg / Mp
+    Lr = 2.0 * E * ry * sqrt_JAg / (0.7 * FyS)
+    Mn_ltb_inel = Cb * (Mp - (Mp - 0.7 * FyS) * ((Lb - Lp) / (Lr - Lp)))
+    Mn_ltb_el = np.divide(
+        2.0 * E * Cb * sqrt_JAg * ry, Lb,
+        out=np.array(inf_arr), where=Lb > 0,
+    )
+    Mn_ltb = np.select(
+        [(Ix <= Iy) | (Lb <= Lp), Lb <= Lr],
+        [inf_arr, np.minimum(Mn_ltb_inel, Mp)],
+        default=np.minimum(Mn_ltb_el, Mp),
+    )
+
+    # 6. Governing Nominal Flexural Strength (NaN propagates)
+    Mn = np.minimum.reduce(
+        [np.broadcast_to(Mp, inf_arr.shape), Mn_flb, Mn_wlb, Mn_ltb]
+    )
+
+    return {
+        "Mn": Mn,
+        "Mp": Mp,
+        "Mn_FLB": Mn_flb,
+        "Mn_WLB": Mn_wlb,
+        "Mn_LTB": Mn_ltb,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _section_props(B, H, t_nom):
+    """
+    Scalar section properties from _hss_geometry.  Independent of Fy, Lb
+    and Cb, so cached.  Returns (t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J).
+    """
+
+    return _hss_geometry(B, H, t_nom, math.sqrt)
+
+
+def calculate_nominal_strength(B, H, t_nom, Fy, Lb, E=E_STEEL, Cb=1.0):
+    """
+    Scalar counterpart of calculate_nominal_strength_batch for a single
+    rectangular HSS.  Returns (Mn, Mp, Mn_FLB, Mn_WLB, Mn_LTB) with inf for
+    limit states that do not apply and NaN for slender webs.
+
+    Section properties use the same sharp-corner model and are approximate
+    and unconservative (Zx and so Mp about 4% high for HSS8x6x1/2).
+    """
+
+    return _f7_limit_states(_section_props(B, H, t_nom), Fy, Lb, E, Cb)
+
+
+def _f7_limit_states(props, Fy, Lb, E=E_STEEL, Cb=1.0):
+    """
+    F7 limit states for a section property tuple laid out as returned by
+    _section_props.  Returns (Mn, Mp, Mn_FLB, Mn_WLB, Mn_LTB).
+    """
+
+    # 1. Section Properties
+    t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J = props
+
+    sqrt_E_Fy = math.sqrt(E / Fy)
+    inv_t = 1.0 / t
+
+    # 2. Plastic Moment Capacity (F7-1)
+    Mp = Fy * Zx
+    FyS = Fy * Sx
+
+    # Compactness (Table B4.1b)
+    bt = b * inv_t
+    ht = h * inv_t
+    flange_class, web_class = classify_hss_f7(bt, ht, Fy, E, sqrt_E_Fy)
+
+    # 3. Flange Local Buckling (F7-2, F7-3, F7-4)
+    if flange_class == COMPACT:
+        Mn_flb = math.inf
+    elif flange_class == NONCOMPACT:
+        term = max(3.57 * bt / sqrt_E_Fy - 4.0, 0.0)
+        Mn_flb = Mp - (Mp - FyS) * term
+    else:
+        inv_b = 1.0 / b
+        be = 1.92 * t * sqrt_E_Fy * (1.0 - 0.38 * t * inv_b * sqrt_E_Fy)
+        Mn_flb = FyS * min(be, b) * inv_b
+
+    # 4. Web Local Buckling (F7-6)
+    if web_class == COMPACT:
+        Mn_wlb = math.inf
+    elif web_class == NONCOMPACT:
+        term = max(0.305 * ht / sqrt_E_Fy - 0.738, 0.0)
+        Mn_wlb = Mp - (Mp - FyS) * term
+    else:
+        Mn_wlb = math.nan  # slender web, F7-7 to F7-9 not covered
+
+    # 5. Lateral-Torsional Buckling (F7-10 to F7-13), major axis only
+    Mn_ltb = math.inf
+    if Ix > Iy:
+        sqrt_JAg = math.sqrt(J * Ag)
+        Lp = 0.13 * E * ry * sqrt_JAg / Mp
+        Lr = 2.0 * E * ry * sqrt_JAg / (0.7 * FyS)
+
+        if Lp < Lb <= Lr:
+            Mn_ltb = Cb * (Mp - (Mp - 0.7 * FyS) * ((Lb - Lp) / (Lr - Lp)))
+            Mn_ltb = min(Mn_ltb, Mp)
+        elif Lb > Lr:
+            Mn_ltb = 2.0 * E * Cb * sqrt_JAg / (Lb / ry)
+            Mn_ltb = min(Mn_ltb, Mp)
+
+    # 6. Governing Nominal Flexural Strength
+    if math.isnan(Mn_wlb):
+        Mn = math.nan
+    else:
+        Mn = min(Mp, Mn_flb, Mn_wlb, Mn_ltb)
+
+    return Mn, Mp, Mn_flb, Mn_wlb, Mn_ltb
+
+
+def f7_sweep(B_arr, H_arr, t_arr, Fy, Lb_arr, E=E_STEEL, Cb=1.0):
+    """
+    Design sweep of a shape catalog (B_arr, H_arr, t_arr) over a set of
+    unbraced lengths.  Fy, E and Cb are each a scalar or one value per
+    shape.  Returns Mn as an (n_shapes, n_Lb) array.
+    """
+
+    def per_shape(x):
+        x = np.asarray(x, dtype=float)
+        return x.ravel()[:, None] if x.ndim else x
+
+    B_arr = np.ravel(np.asarray(B_arr, dtype=float))[:, None]
+    H_arr = np.ravel(np.asarray(H_arr, dtype=float))[:, None]
+    t_arr = np.ravel(np.asarray(t_arr, dtype=float))[:, None]
+    Lb_arr = np.ravel(np.asarray(Lb_arr, dtype=float))[None, :]
+
+    result = calculate_nominal_strength_batch(
+        B_arr, H_arr, t_arr, per_shape(Fy), Lb_arr,
+        E=per_shape(E), Cb=per_shape(Cb),
+    )
+    return result["Mn"]
+
+
+def f7_mesh(B_vec, H_vec, t_vec, Lb_vec, Fy, E=E_STEEL, Cb=1.0):
+    """
+    Mn over the full (B, H, t_nom, Lb) design grid.  The axes are combined
+    with a sparse meshgrid, so only the final limit-state arrays are
+    materialised at full size.  Returns an (n_B, n_H, n_t, n_Lb) array.
+    """
+
+    B, H, t_nom, Lb = np.meshgrid(
+        np.asarray(B_vec, dtype=float),
+        np.asarray(H_vec, dtype=float),
+        np.asarray(t_vec, dtype=float),
+        np.asarray(Lb_vec, dtype=float),
+        indexing="ij",
+        sparse=True,
+    )
+
+    result = calculate_nominal_strength_batch(B, H, t_nom, Fy, Lb, E=E, Cb=Cb)
+    return result["Mn"]
+
+
+def _shape_key(name):
+    """
+    Table key for a shape name.  AISC labels are written "HSS8X6X1/2" but
+    callers commonly use "HSS8x6x1/2", so keys are upper-cased.
+    """
+
+    return name.strip().upper()
+
+
+_SHAPES_DB_COLUMNS = (
+    "Type", "AISC_Manual_Label", "A", "Ix", "Zx", "Sx", "Iy", "ry", "J",
+    "tdes", "b/tdes", "h/tdes",
+)
+
+
+def load_aisc_shapes_db(path):
+    """
+    Load rectangular HSS rows from a CSV export of the AISC Shapes
+    Database.  Returns a new dict of section properties, in the
+    _section_props tuple layout, keyed by upper-cased AISC_Manual_Label.
+    """
+
+    shapes = {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+
+        fieldnames = reader.fieldnames or ()
+        missing = [c for c in _SHAPES_DB_COLUMNS if c not in fieldnames]
+        if missing:
+            raise ValueError(
+                f"{path} is missing AISC Shapes Database columns: "
+                + ", ".join(missing)
+            )
+
+        for row in reader:
+            if row["Type"] != "HSS":
+                continue
+            try:
+                t = float(row["tdes"])
+                props = (
+                    t,
+                    float(row["b/tdes"]) * t,
+                    float(row["h/tdes"]) * t,
+                    float(row["Ix"]),
+                    float(row["Sx"]),
+                    float(row["Zx"]),
+                    float(row["Iy"]),
+                    float(row["A"]),
+                    float(row["ry"]),
+                    float(row["J"]),
+                )
+            except ValueError:
+                continue  # round HSS: flat-width columns are blank ("–")
+
+            shapes[_shape_key(row["AISC_Manual_Label"])] = props
+
+    return shapes
+
+
+def parse_hss_designation(name):
+    """
+    Split an HSS designation such as "HSS8x6x1/2" or "HSS3-1/2x2-1/2x1/4"
+    into (B, H, t_nom), with H the first (depth) dimension.
+    """
+
+    if not name.upper().startswith("HSS"):
+        raise ValueError(f"Not an HSS designation: {name}")
+
+    dims = []
+    for part in name[3:].lower().split("x"):
+        whole, _, frac = part.rpartition("-")
+        if "/" in part and whole:
+            dims.append(float(int(whole) + Fraction(frac)))
+        else:
+            dims.append(float(Fraction(part)))
+
+    if len(dims) != 3:
+        raise ValueError(f"Not a rectangular HSS designation: {name}")
+
+    H, B, t_nom = dims
+    return B, H, t_nom
+
+
+def f7_check_shape(name, Fy, Lb, E=E_STEEL, Cb=1.0, shapes=None):
+    """
+    F7 limit states for a named HSS.  Uses published properties when the
+    shape is in shapes (from load_aisc_shapes_db), otherwise derives them
+    from the designation with the approximate, unconservative sharp-corner
+    model.  Returns (Mn, Mp, Mn_FLB, Mn_WLB, Mn_LTB).
+    """
+
+    props = None if shapes is None else shapes.get(_shape_key(name))
+    if props is None:
+        B, H, t_nom = parse_hss_designation(name)
+        return calculate_nominal_strength(B, H, t_nom, Fy, Lb, E, Cb)
+
+    return _f7_limit_states(props, Fy, Lb, E, Cb)
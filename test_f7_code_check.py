@@ -0,0 +1,180 @@
+import importlib.util
+import math
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    "f7_code_check",
+    os.path.join(os.path.dirname(__file__), "F7-code-check v1.py"),
+)
+f7 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(f7)
+
+
+def test_slender_flange_effective_width():
+    # 14 x 10 x 3/16 HSS, Fy = 50 ksi: b/t = 54.3 > 1.40*sqrt(E/Fy) = 33.7.
+    # F7-4 multiplies by sqrt(E/Fy); dividing by it gave Mn_FLB = 1461.8.
+    t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J = f7._section_props(10.0, 14.0, 0.1875)
+
+    result = f7.flexural_strength_hss_f7(
+        50.0, 29000.0, Ag,
+        Zx, Sx,
+        ry, J,
+        b, t, h, t,
+        0.0, 1.0,
+        "SectionType.HSS", f7.MAJOR, f7.SLENDER, f7.NONCOMPACT,
+    )
+
+    assert math.isclose(result["Mn_FLB"], 1215.97, abs_tol=0.01)
+    assert result["governing_limit_state"] == "Flange Local Buckling"
+
+    Mn_flb = f7.calculate_nominal_strength(10.0, 14.0, 0.1875, 50.0, 0.0)[2]
+    assert math.isclose(Mn_flb, result["Mn_FLB"])
+
+
+_SHAPES_CSV = """\
+Type,AISC_Manual_Label,A,Ix,Zx,Sx,Iy,ry,J,tdes,b/tdes,h/tdes
+HSS,HSS8X6X1/2,12.4,103,31.3,25.8,65.4,2.30,134,0.465,9.90,14.2
+HSS,HSS6.000X0.500,8.09,31.2,14.3,10.4,31.2,1.96,62.4,0.465,–,–
+"""
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("HSS8x6x1/2", (6.0, 8.0, 0.5)),
+    ("HSS8X6X1/2", (6.0, 8.0, 0.5)),
+    ("HSS3-1/2x2-1/2x1/4", (2.5, 3.5, 0.25)),
+    ("HSS12x4x.500", (4.0, 12.0, 0.5)),
+])
+def test_parse_hss_designation(name, expected):
+    assert f7.parse_hss_designation(name) == expected
+
+
+@pytest.mark.parametrize("name", ["W8x31", "HSS6.000x0.500"])
+def test_parse_hss_designation_rejects_other_shapes(name):
+    with pytest.raises(ValueError):
+        f7.parse_hss_designation(name)
+
+
+def test_load_aisc_shapes_db(tmp_path):
+    path = tmp_path / "shapes.csv"
+    path.write_text(_SHAPES_CSV, encoding="utf-8")
+
+    shapes = f7.load_aisc_shapes_db(path)
+
+    # Round HSS rows have no flat widths and are skipped
+    assert list(shapes) == ["HSS8X6X1/2"]
+    t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J = shapes["HSS8X6X1/2"]
+    assert math.isclose(b, 9.90 * 0.465)
+    assert Zx == 31.3
+
+
+def test_f7_check_shape_uses_published_properties(tmp_path):
+    path = tmp_path / "shapes.csv"
+    path.write_text(_SHAPES_CSV, encoding="utf-8")
+    shapes = f7.load_aisc_shapes_db(path)
+
+    # Lookup ignores case; Mp = Fy * published Zx
+    Mn, Mp, *_ = f7.f7_check_shape("hss8x6x1/2", 50.0, 100.0, shapes=shapes)
+    assert math.isclose(Mp, 50.0 * 31.3)
+    assert math.isclose(Mn, Mp)
+
+    # Without the table the sharp-corner geometry is used instead
+    Mp_computed = f7.f7_check_shape("HSS8x6x1/2", 50.0, 100.0)[1]
+    assert not math.isclose(Mp_computed, Mp)
+
+
+def test_load_aisc_shapes_db_missing_columns(tmp_path):
+    path = tmp_path / "shapes.csv"
+    path.write_text(
+        _SHAPES_CSV.replace("b/tdes", "b/t").replace("h/tdes", "h/t"),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="b/tdes, h/tdes"):
+        f7.load_aisc_shapes_db(path)
+
+
+def test_slender_web_is_not_covered():
+    # 40 x 6 x 1/8 HSS: h/t = 341 > 5.70*sqrt(E/Fy) = 137
+    t, b, h, Ix, Sx, Zx, Iy, Ag, ry, J = f7._section_props(6.0, 40.0, 0.125)
+    flange_class, web_class = f7.classify_hss_f7(b / t, h / t, 50.0)
+    assert web_class == f7.SLENDER
+
+    result = f7.flexural_strength_hss_f7(
+        50.0, 29000.0, Ag,
+        Zx, Sx,
+        ry, J,
+        b, t, h, t,
+        0.0, 1.0,
+        "SectionType.HSS", f7.MAJOR, flange_class, web_class,
+    )
+
+    assert math.isnan(result["Mn_WLB"])
+    assert math.isnan(result["Mn"])
+    assert result["status"] == "NOT COVERED"
+    assert math.isnan(f7.calculate_nominal_strength(6.0, 40.0, 0.125, 50.0, 0.0)[0])
+
+
+_B = [4.0, 6.0, 10.0]
+_H = [8.0, 14.0, 40.0]
+_T = [0.125, 0.25, 0.5]
+_LB = [0.0, 120.0, 600.0, 3000.0]
+
+
+def test_batch_matches_scalar():
+    B, H, t_nom, Lb = np.meshgrid(_B, _H, _T, _LB, indexing="ij")
+    batch = f7.calculate_nominal_strength_batch(B, H, t_nom, 50.0, Lb, Cb=1.14)
+
+    keys = ("Mn", "Mp", "Mn_FLB", "Mn_WLB", "Mn_LTB")
+    for idx in np.ndindex(B.shape):
+        scalar = f7.calculate_nominal_strength(
+            B[idx], H[idx], t_nom[idx], 50.0, Lb[idx], Cb=1.14
+        )
+        for key, value in zip(keys, scalar):
+            np.testing.assert_allclose(batch[key][idx], value, rtol=1e-12)
+
+
+def test_batch_slender_web_is_nan():
+    result = f7.calculate_nominal_strength_batch(
+        [10.0, 6.0], [14.0, 40.0], [0.1875, 0.125], 50.0, 0.0
+    )
+
+    assert np.isfinite(result["Mn"][0])
+    assert np.isnan(result["Mn_WLB"][1])
+    assert np.isnan(result["Mn"][1])
+
+
+def test_batch_braced_member_has_no_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = f7.calculate_nominal_strength_batch(
+            _B, [14.0, 14.0, 14.0], 0.25, 50.0, 0.0
+        )
+
+    assert np.isinf(result["Mn_LTB"]).all()
+
+
+def test_sweep_shape():
+    Mn = f7.f7_sweep(_B, _H, _T, 50.0, _LB)
+    assert Mn.shape == (3, 4)
+
+    assert f7.f7_sweep(_B, _H, _T, 50.0, 120.0).shape == (3, 1)
+
+
+def test_sweep_per_shape_cb():
+    # LTB governs both shapes at Lb = 1500, so Cb scales Mn per row
+    Mn = f7.f7_sweep([3.0, 3.0], [12.0, 12.0], [0.5, 0.5], 50.0, [1500.0],
+                     Cb=[1.0, 1.3])
+
+    assert math.isclose(Mn[1, 0], 1.3 * Mn[0, 0])
+
+
+def test_mesh_shape():
+    Mn = f7.f7_mesh(_B, _H[:2], _T, _LB, 50.0)
+    assert Mn.shape == (3, 2, 3, 4)
+
+    expected = f7.calculate_nominal_strength(_B[2], _H[1], _T[0], 50.0, _LB[3])
+    assert math.isclose(Mn[2, 1, 0, 3], expected[0])